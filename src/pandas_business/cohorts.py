@@ -1,69 +1,172 @@
-from typing import List, Dict, Tuple
+from functools import partial
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple, Union
 
 import datetime as dt
+import numpy as np
 import pandas as pd
 from pandas_flavor import register_dataframe_method
 
+# groupby operations that accept the `engine` and `engine_kwargs` arguments
+ENGINE_METRIC_OPERATIONS = {"sum", "mean", "min", "max", "std", "var"}
 
-def create_year_month(df, date_col, new_col):
+# granularities counted on the calendar of the wall-clock dates, instead of
+# on the time elapsed between the two instants
+CALENDAR_GRANULARITIES = {"monthly"}
+
+
+def wall_clock_dates(dates: pd.Series) -> np.ndarray:
     """
-    Creates a new column in the DataFrame with the year and month extracted from the specified date column.
+    Returns the values of a datetime Series as a datetime64 array of wall-clock times.
+
+    Time zone aware values keep their local time, so that labels follow the calendar of their time zone.
 
     Args:
-        df (pd.DataFrame): The input DataFrame.
-        date_col (str): The name of the date column.
-        new_col (str): The name of the new column to be created.
+        dates (pd.Series): The datetime Series.
 
     Returns:
-        pd.DataFrame: The updated DataFrame with the new column added.
+        np.ndarray: The datetime64 array.
+    """
+    if isinstance(dates.dtype, pd.DatetimeTZDtype):
+        dates = dates.dt.tz_localize(None)
+    return dates.to_numpy()
+
+
+def instant_dates(dates: pd.Series) -> np.ndarray:
     """
-    mask = df[date_col].notnull()
+    Returns the values of a datetime Series as a datetime64 array of instants.
+
+    Time zone aware values are converted to UTC, so that differences measure the elapsed time.
+
+    Args:
+        dates (pd.Series): The datetime Series.
 
-    df[new_col] = (
-        df.loc[mask, date_col].dt.year.astype("str")
-        + "-"
-        + df.loc[mask, date_col].apply(lambda x: x.strftime("%m"))
+    Returns:
+        np.ndarray: The datetime64 array.
+    """
+    if isinstance(dates.dtype, pd.DatetimeTZDtype):
+        dates = dates.dt.tz_convert("UTC").dt.tz_localize(None)
+    return dates.to_numpy()
+
+
+def categorize_dates(
+    dates: np.ndarray, labeler: Callable[[pd.DatetimeIndex], Any]
+) -> pd.Categorical:
+    """
+    Labels a datetime64 array as a Categorical, computing the label of each distinct value only once.
+
+    Args:
+        dates (np.ndarray): The datetime64 array, ideally truncated to the resolution of the labels.
+        labeler (Callable[[pd.DatetimeIndex], Any]): Maps the distinct non-NaT dates to their labels.
+
+    Returns:
+        pd.Categorical: The labels, NaN where `dates` is NaT.
+    """
+    nat = np.isnat(dates)
+    ticks = dates.view("int64")
+    valid_ticks = ticks[~nat]
+    if valid_ticks.size and valid_ticks.max() - valid_ticks.min() < valid_ticks.size:
+        # dense range of periods: the offset from the first one is the code,
+        # which avoids sorting the whole array
+        first = valid_ticks.min()
+        uniques = np.arange(first, valid_ticks.max() + 1).view(dates.dtype)
+        codes = ticks - first
+        codes[nat] = 0
+    else:
+        uniques, codes = np.unique(dates, return_inverse=True)
+        codes = codes.reshape(-1)
+
+    label_codes, categories = pd.factorize(
+        labeler(pd.DatetimeIndex(uniques)), sort=True
     )
-    return df
+    return pd.Categorical.from_codes(
+        np.where(nat, -1, label_codes[codes]), categories=categories
+    )
+
 
+def constant_categorical(value: Any, length: int) -> pd.Categorical:
+    """
+    Returns a Categorical repeating a single value, which is cheap to build and to group by.
+
+    Args:
+        value (Any): The value to repeat.
+        length (int): The length of the Categorical.
+
+    Returns:
+        pd.Categorical: The Categorical with `value` repeated `length` times.
+    """
+    return pd.Categorical.from_codes(np.zeros(length, dtype="int8"), categories=[value])
 
-def create_year_week(df, date_col, new_col):
+
+def decode_categorical_cols(df: pd.DataFrame) -> pd.DataFrame:
     """
-    Creates a new column in the DataFrame with the year and week number extracted from the specified date column.
+    Converts the categorical columns of the DataFrame back to the dtype of their categories.
+
+    Datetime categories come from `date_labels` and are returned as `datetime.date` objects.
 
     Args:
         df (pd.DataFrame): The input DataFrame.
-        date_col (str): The name of the date column.
-        new_col (str): The name of the new column to be created.
 
     Returns:
-        pd.DataFrame: The updated DataFrame with the new column added.
+        pd.DataFrame: The updated DataFrame without categorical columns.
+    """
+    for col in df.select_dtypes("category").columns:
+        df[col] = df[col].astype(df[col].cat.categories.dtype)
+        if isinstance(df[col].dtype, np.dtype) and df[col].dtype.kind == "M":
+            df[col] = df[col].dt.date
+    return df
+
+
+def year_month_labels(dates: np.ndarray) -> pd.Categorical:
     """
-    mask = df[date_col].notnull()
+    Returns the 'YYYY-MM' labels of a datetime64 array.
 
-    df[new_col] = (
-        df.loc[mask, date_col].dt.year.astype("str")
-        + "-"
-        + df.loc[mask, date_col].apply(lambda x: x.strftime("%W"))
+    Args:
+        dates (np.ndarray): The datetime64 array.
+
+    Returns:
+        pd.Categorical: The labels, NaN where `dates` is NaT.
+    """
+    return categorize_dates(
+        dates.astype("datetime64[M]"), lambda x: x.strftime("%Y-%m")
     )
-    return df
 
 
-def create_date(df, date_col, new_col):
+def year_week_labels(dates: np.ndarray) -> pd.Categorical:
     """
-    Creates a new column in the DataFrame with only the date part extracted from the specified date column.
+    Returns the 'YYYY-WW' labels of a datetime64 array, weeks starting on Monday.
 
     Args:
-        df (pd.DataFrame): The input DataFrame.
-        date_col (str): The name of the date column.
-        new_col (str): The name of the new column to be created.
+        dates (np.ndarray): The datetime64 array.
 
     Returns:
-        pd.DataFrame: The updated DataFrame with the new column added.
+        pd.Categorical: The labels, NaN where `dates` is NaT.
     """
-    df[new_col] = df[date_col].dt.date
+    return categorize_dates(
+        dates.astype("datetime64[D]"), lambda x: x.strftime("%Y-%W")
+    )
 
-    return df
+
+def date_labels(dates: np.ndarray) -> pd.Categorical:
+    """
+    Returns the date part of a datetime64 array, keeping datetime64 categories so that no `datetime.date` objects are built.
+
+    Args:
+        dates (np.ndarray): The datetime64 array.
+
+    Returns:
+        pd.Categorical: The dates, NaN where `dates` is NaT.
+    """
+    return categorize_dates(dates.astype("datetime64[D]"), lambda x: x)
+
+
+# python tricks etl_machine: one function per granularity, picked once
+DIFF_BETWEEN_DATES = {
+    "daily": lambda end_date, start_date: (end_date - start_date).days,
+    "weekly": lambda end_date, start_date: int((end_date - start_date).days / 7),
+    "monthly": lambda end_date, start_date: (
+        (end_date.year - start_date.year) * 12 + end_date.month - start_date.month
+    ),
+}
 
 
 def calculate_diff_between_dates(granularity: str, end_date, start_date):
@@ -78,55 +181,104 @@ def calculate_diff_between_dates(granularity: str, end_date, start_date):
     Returns:
         int: The difference between the dates based on the specified granularity.
     """
-    # python tricks etl_machine
-    if granularity == "daily":
-        diff = (end_date - start_date).days
-    elif granularity == "weekly":
-        diff = int((end_date - start_date).days / 7)
-    elif granularity == "monthly":
-        diff = (
-            (end_date.year - start_date.year) * 12 + end_date.month - start_date.month
-        )
-    return diff
+    return DIFF_BETWEEN_DATES[granularity](end_date, start_date)
 
 
-def cohort_base(
-    df: pd.DataFrame,
-    cohort_column: str,  # evento contador a 0: installation, contract, first_use, first_purchase
-    cohort_row: str,  # fecha de transacción ya en formato cohort: purchase_date, purchase_month, purchase_week
-    metric_target_col: str,  # billing
-    metric_operation: str,  # 'sum'
-) -> pd.DataFrame:
+def downcast_integers(values: np.ndarray) -> np.ndarray:
     """
-    Performs cohort analysis on the DataFrame and aggregates the metric values based on the specified columns and operations.
+    Casts an integer array to the smallest of int16, int32 and int64 that holds its values.
 
     Args:
-        df (pd.DataFrame): The input DataFrame.
-        cohort_column (str): The column representing the cohort event with a counter starting from 0.
-        cohort_row (str): The column representing the cohort row (e.g., purchase date, purchase month, purchase week).
+        values (np.ndarray): The integer array.
+
+    Returns:
+        np.ndarray: The downcast array.
+    """
+    if values.size == 0:
+        return values.astype("int16")
+    low, high = values.min(), values.max()
+    for dtype in ("int16", "int32"):
+        info = np.iinfo(dtype)
+        if info.min <= low and high <= info.max:
+            return values.astype(dtype)
+    return values
+
+
+# vectorized counterparts of DIFF_BETWEEN_DATES, over datetime64 arrays
+DIFF_BETWEEN_DATE_ARRAYS = {
+    "daily": lambda end_dates, start_dates: (
+        (end_dates - start_dates) // np.timedelta64(1, "D")
+    ),
+    # truncate towards zero, as int() does in the scalar version
+    "weekly": lambda end_dates, start_dates: (
+        ((end_dates - start_dates) // np.timedelta64(1, "D")) / 7
+    ),
+    "monthly": lambda end_dates, start_dates: (
+        end_dates.astype("datetime64[M]") - start_dates.astype("datetime64[M]")
+    ),
+}
+
+
+def calculate_diff_between_date_arrays(
+    granularity: str, end_dates: np.ndarray, start_dates: np.ndarray
+) -> np.ndarray:
+    """
+    Calculates the element-wise difference between two datetime64 arrays based on the specified granularity.
+
+    Vectorized counterpart of `calculate_diff_between_dates`.
+
+    Args:
+        granularity (str): The granularity of the difference calculation. Valid values: 'daily', 'weekly', 'monthly'.
+        end_dates (np.ndarray): The end dates.
+        start_dates (np.ndarray): The start dates.
+
+    Returns:
+        np.ndarray: The differences between the dates based on the specified granularity, in the smallest integer dtype from int16 up that holds them.
+    """
+    diff = DIFF_BETWEEN_DATE_ARRAYS[granularity](end_dates, start_dates)
+    return downcast_integers(diff.astype("int64"))
+
+
+def operation_name(metric_operation: Union[str, Callable]) -> str:
+    """
+    Returns the name of an aggregation operation, as used in the metric names.
+
+    Args:
+        metric_operation (Union[str, Callable]): The aggregation operation, a name or a function.
+
+    Returns:
+        str: The name of the operation.
+    """
+    if isinstance(metric_operation, str):
+        return metric_operation
+    return getattr(metric_operation, "__name__", str(metric_operation))
+
+
+def aggregate_metric(
+    grouped: pd.core.groupby.DataFrameGroupBy,
+    metric_target_col: str,
+    metric_operation: str,
+    engine: Optional[str] = None,
+    engine_kwargs: Optional[Dict[str, bool]] = None,
+) -> pd.Series:
+    """
+    Aggregates a metric column of a grouped DataFrame, using the specified engine when the operation supports it.
+
+    Args:
+        grouped (pd.core.groupby.DataFrameGroupBy): The grouped DataFrame.
         metric_target_col (str): The column containing the metric values.
         metric_operation (str): The aggregation operation to apply to the metric values.
+        engine (str, optional): The groupby engine, e.g. 'numba'. Defaults to None.
+        engine_kwargs (Dict[str, bool], optional): The engine options, e.g. {'parallel': True}. Defaults to None.
 
     Returns:
-        pd.DataFrame: The DataFrame with aggregated cohort metrics.
+        pd.Series: The aggregated metric values.
     """
-
-    df = (
-        df.groupby(
-            [
-                cohort_row,
-                cohort_column,
-                "cohort_event",
-                "row_granularity",
-                "col_granularity",
-                "metric_name",
-            ]
+    if engine is not None and metric_operation in ENGINE_METRIC_OPERATIONS:
+        return getattr(grouped[metric_target_col], metric_operation)(
+            engine=engine, engine_kwargs=engine_kwargs
         )
-        .agg({metric_target_col: metric_operation})
-        .reset_index()
-        .rename(columns={metric_target_col: "metric_value"})
-    )
-    return df
+    return grouped[metric_target_col].agg(metric_operation)
 
 
 def cohort_metrics(
@@ -134,6 +286,8 @@ def cohort_metrics(
     cohort_row: str,
     cohort_column: str,  # evento contador a 0: installation, contract, first_use, first_purchase
     metrics: Dict[str, List[str]],  # {'billing': ['sum', 'mean']
+    engine: Optional[str] = None,
+    engine_kwargs: Optional[Dict[str, bool]] = None,
 ):
 
     """
@@ -144,20 +298,85 @@ def cohort_metrics(
         cohort_row (str): The column representing the cohort row.
         cohort_column (str): The column representing the cohort column.
         metrics (Dict[str, List[str]]): A dictionary mapping metric target columns to a list of metric operations.
+        engine (str, optional): The groupby engine for the operations that support it, e.g. 'numba'. Defaults to None.
+        engine_kwargs (Dict[str, bool], optional): The engine options, e.g. {'parallel': True}. Defaults to None.
 
     Yields:
-        pd.DataFrame: The DataFrame with cohort metrics for each metric operation.
-    """
-    for metric_target_col, metric_operations in metrics.items():
-        for metric_operation in metric_operations:
-            df["metric_name"] = f"{metric_target_col}_{metric_operation}"
-            yield cohort_base(
-                df=df,
-                cohort_column=cohort_column,
-                cohort_row=cohort_row,
-                metric_target_col=metric_target_col,
-                metric_operation=metric_operation,
-            )
+        pd.DataFrame: The DataFrame with cohort metrics for all the metric operations, one row per metric name.
+    """
+    # metrics without operations produce no rows
+    metrics = {
+        metric_target_col: metric_operations
+        for metric_target_col, metric_operations in metrics.items()
+        if metric_operations
+    }
+    if len(df) == 0 or not metrics:
+        return
+
+    # a single groupby aggregates every (metric_target_col, metric_operation) pair
+    grouped = df.groupby(
+        [
+            cohort_row,
+            cohort_column,
+            "cohort_event",
+            "row_granularity",
+            "col_granularity",
+        ],
+        sort=False,
+        observed=True,
+    )
+    operations = [
+        (metric_target_col, metric_operation)
+        for metric_target_col, metric_operations in metrics.items()
+        for metric_operation in metric_operations
+    ]
+    if engine is None:
+        df_agg = grouped.agg(metrics)
+    else:
+        df_agg = pd.concat(
+            [
+                aggregate_metric(
+                    grouped,
+                    metric_target_col,
+                    metric_operation,
+                    engine=engine,
+                    engine_kwargs=engine_kwargs,
+                )
+                for metric_target_col, metric_operation in operations
+            ],
+            axis=1,
+        )
+    # both paths produce one column per (metric_target_col, metric_operation), in order
+    df_agg.columns = [
+        f"{metric_target_col}_{operation_name(metric_operation)}"
+        for metric_target_col, metric_operation in operations
+    ]
+    df_agg = df_agg.melt(
+        var_name="metric_name", value_name="metric_value", ignore_index=False
+    ).reset_index()
+    if df_agg[cohort_column].dtype.kind == "i":
+        # the period diffs are downcast while grouping only
+        df_agg[cohort_column] = df_agg[cohort_column].astype("int64")
+    yield decode_categorical_cols(df_agg)
+
+
+def memoize(cache: Optional[Dict], key: Any, compute: Callable[[], Any]) -> Any:
+    """
+    Returns the value stored in the cache under the key, computing and storing it if missing.
+
+    Args:
+        cache (Dict, optional): The cache. If None, the value is always computed.
+        key (Any): The key of the value.
+        compute (Callable[[], Any]): Computes the value.
+
+    Returns:
+        Any: The cached or computed value.
+    """
+    if cache is None:
+        return compute()
+    if key not in cache:
+        cache[key] = compute()
+    return cache[key]
 
 
 def add_cohort_granularity_cols(
@@ -168,6 +387,11 @@ def add_cohort_granularity_cols(
     cohort_column_granularity: str,
     use_months: bool,
     create_cohort_cols: bool = True,
+    start_dates: Optional[np.ndarray] = None,
+    end_dates: Optional[np.ndarray] = None,
+    start_instants: Optional[np.ndarray] = None,
+    end_instants: Optional[np.ndarray] = None,
+    cache: Optional[Dict[Tuple[str, str], Any]] = None,
 ) -> pd.DataFrame:
     """
     Adds cohort granularity columns to the DataFrame based on the specified event columns, row and column granularities, and options.
@@ -180,33 +404,117 @@ def add_cohort_granularity_cols(
         cohort_column_granularity (str): The granularity of the cohort column. Valid values: 'monthly', 'weekly', 'daily'.
         use_months (bool): Indicates whether to use months for cohort column if cohort_column_granularity is 'monthly'.
         create_cohort_cols (bool, optional): Indicates whether to create cohort column. Defaults to True.
+        start_dates (np.ndarray, optional): The wall-clock values of `cohort_event_col`, if already extracted. Defaults to None.
+        end_dates (np.ndarray, optional): The wall-clock values of `transaction_event_col`, if already extracted. Defaults to None.
+        start_instants (np.ndarray, optional): The instants of `cohort_event_col`, if already extracted. Defaults to None.
+        end_instants (np.ndarray, optional): The instants of `transaction_event_col`, if already extracted. Defaults to None.
+        cache (Dict[Tuple[str, str], Any], optional): Stores the computed cohort columns by granularity, to be reused by later calls with the same event columns. Defaults to None.
 
     Returns:
         pd.DataFrame: The updated DataFrame with cohort granularity columns added.
     """
-    if create_cohort_cols:
-        df["cohort_column"] = df.apply(
-            lambda x: calculate_diff_between_dates(
-                cohort_column_granularity, x[transaction_event_col], x[cohort_event_col]
-            ),
-            axis=1,
-        )
+    if start_dates is None:
+        start_dates = wall_clock_dates(df[cohort_event_col])
+    if end_dates is None:
+        end_dates = wall_clock_dates(df[transaction_event_col])
+    if start_instants is None:
+        start_instants = instant_dates(df[cohort_event_col])
+    if end_instants is None:
+        end_instants = instant_dates(df[transaction_event_col])
 
     if use_months:
-        df = create_year_month(df, transaction_event_col, "cohort_column")
+        df["cohort_column"] = memoize(
+            cache, ("cohort_column", "months"), lambda: year_month_labels(end_dates)
+        )
+
+    elif create_cohort_cols:
+        calendar = cohort_column_granularity in CALENDAR_GRANULARITIES
+        df["cohort_column"] = memoize(
+            cache,
+            ("cohort_column", cohort_column_granularity),
+            lambda: calculate_diff_between_date_arrays(
+                cohort_column_granularity,
+                end_dates if calendar else end_instants,
+                start_dates if calendar else start_instants,
+            ),
+        )
 
     if cohort_row_granularity == "monthly":
-        df = create_year_month(df, cohort_event_col, "cohort_row")
+        df["cohort_row"] = memoize(
+            cache, ("cohort_row", "monthly"), lambda: year_month_labels(start_dates)
+        )
 
     elif cohort_row_granularity == "weekly":
-        df = create_year_week(df, cohort_event_col, "cohort_row")
+        df["cohort_row"] = memoize(
+            cache, ("cohort_row", "weekly"), lambda: year_week_labels(start_dates)
+        )
 
     elif cohort_row_granularity == "daily":
-        df = create_date(df, cohort_event_col, "cohort_row")
+        df["cohort_row"] = memoize(
+            cache, ("cohort_row", "daily"), lambda: date_labels(start_dates)
+        )
 
     return df
 
 
+def cohort_granularity_frames(
+    df: pd.DataFrame,
+    cohort_event_cols: List[str],
+    transaction_event_col: str,
+    row_col_granularities: List[Tuple[str, str]],
+    use_months: bool,
+) -> Iterator[pd.DataFrame]:
+    """
+    Yields the DataFrame with its cohort columns for every cohort event column and row and column granularity.
+
+    Args:
+        df (pd.DataFrame): The input DataFrame.
+        cohort_event_cols (List[str]): The list of cohort event columns.
+        transaction_event_col (str): The column representing the transaction event.
+        row_col_granularities (List[Tuple[str, str]]): The list of tuples representing row and column granularities.
+        use_months (bool): Indicates whether to use months for cohort column if cohort_column_granularity is 'monthly'.
+
+    Yields:
+        pd.DataFrame: The DataFrame with the cohort_row, cohort_column, cohort_event, row_granularity and col_granularity columns.
+    """
+    for cohort_event_col in cohort_event_cols:
+        df_event = df.dropna(subset=[cohort_event_col, transaction_event_col])
+        if len(df_event) == 0:
+            continue
+        # shared by every granularity of this cohort event
+        start_dates = wall_clock_dates(df_event[cohort_event_col])
+        end_dates = wall_clock_dates(df_event[transaction_event_col])
+        start_instants = instant_dates(df_event[cohort_event_col])
+        end_instants = instant_dates(df_event[transaction_event_col])
+        cohort_event = constant_categorical(cohort_event_col, len(df_event))
+        cache = {}
+
+        for row_granularity, col_granularity in row_col_granularities:
+            # shallow copy: only new columns are assigned on df_temp
+            df_temp = add_cohort_granularity_cols(
+                df=df_event.copy(deep=False),
+                cohort_event_col=cohort_event_col,
+                transaction_event_col=transaction_event_col,
+                cohort_row_granularity=row_granularity,
+                cohort_column_granularity=col_granularity,
+                use_months=use_months,
+                start_dates=start_dates,
+                end_dates=end_dates,
+                start_instants=start_instants,
+                end_instants=end_instants,
+                cache=cache,
+            )
+            df_temp["cohort_event"] = cohort_event
+            df_temp["row_granularity"] = constant_categorical(
+                row_granularity, len(df_temp)
+            )
+            df_temp["col_granularity"] = constant_categorical(
+                col_granularity, len(df_temp)
+            )
+
+            yield df_temp
+
+
 def cohort_granularity_metrics(
     df: pd.DataFrame,
     cohort_event_cols: List[
@@ -216,6 +524,8 @@ def cohort_granularity_metrics(
     metrics: Dict[str, List[str]],  # {'billing': ['sum', 'mean']}
     row_col_granularities: List[Tuple[str, str]],
     use_months: bool,
+    engine: Optional[str] = None,
+    engine_kwargs: Optional[Dict[str, bool]] = None,
 ):
 
     """
@@ -228,33 +538,96 @@ def cohort_granularity_metrics(
         metrics (Dict[str, List[str]]): A dictionary mapping metric target columns to a list of metric operations.
         row_col_granularities (List[Tuple[str, str]]): The list of tuples representing row and column granularities.
         use_months (bool): Indicates whether to use months for cohort column if cohort_column_granularity is 'monthly'.
+        engine (str, optional): The groupby engine for the operations that support it, e.g. 'numba'. Defaults to None.
+        engine_kwargs (Dict[str, bool], optional): The engine options, e.g. {'parallel': True}. Defaults to None.
 
     Yields:
         pd.DataFrame: The DataFrame with cohort granularity metrics.
     """
-    for cohort_event_col in cohort_event_cols:
-        for row_granularity, col_granularity in row_col_granularities:
-            df.dropna(subset=[cohort_event_col, transaction_event_col], inplace=True)
-            if len(df) == 0:
-                continue
-            df_temp = add_cohort_granularity_cols(
-                df=df,
-                cohort_event_col=cohort_event_col,
-                transaction_event_col=transaction_event_col,
-                cohort_row_granularity=row_granularity,
-                cohort_column_granularity=col_granularity,
-                use_months=use_months,
-            )
-            df_temp["cohort_event"] = cohort_event_col
-            df_temp["row_granularity"] = row_granularity
-            df_temp["col_granularity"] = col_granularity
-
-            yield cohort_metrics(
-                df=df_temp,
-                cohort_row="cohort_row",
-                cohort_column="cohort_column",
-                metrics=metrics,
-            )
+    for df_temp in cohort_granularity_frames(
+        df=df,
+        cohort_event_cols=cohort_event_cols,
+        transaction_event_col=transaction_event_col,
+        row_col_granularities=row_col_granularities,
+        use_months=use_months,
+    ):
+        yield from cohort_metrics(
+            df=df_temp,
+            cohort_row="cohort_row",
+            cohort_column="cohort_column",
+            metrics=metrics,
+            engine=engine,
+            engine_kwargs=engine_kwargs,
+        )
+
+
+def collect_cohort_metrics(df: pd.DataFrame, **kwargs) -> List[pd.DataFrame]:
+    """
+    Returns the frames yielded by `cohort_metrics` as a list.
+
+    Args:
+        df (pd.DataFrame): The input DataFrame.
+        **kwargs: The remaining arguments of `cohort_metrics`.
+
+    Returns:
+        List[pd.DataFrame]: The DataFrames with cohort metrics.
+    """
+    return list(cohort_metrics(df=df, **kwargs))
+
+
+def dask_cohort_granularity_metrics(
+    df: pd.DataFrame,
+    cohort_event_cols: List[str],
+    transaction_event_col: str,
+    metrics: Dict[str, List[str]],
+    row_col_granularities: List[Tuple[str, str]],
+    use_months: bool,
+    engine: Optional[str] = None,
+    engine_kwargs: Optional[Dict[str, bool]] = None,
+) -> List[pd.DataFrame]:
+    """
+    Computes the cohort granularity metrics with Dask, aggregating every cohort event column and granularity as a parallel task.
+
+    Args:
+        df (pd.DataFrame): The input DataFrame.
+        cohort_event_cols (List[str]): The list of cohort event columns.
+        transaction_event_col (str): The column representing the transaction event.
+        metrics (Dict[str, List[str]]): A dictionary mapping metric target columns to a list of metric operations.
+        row_col_granularities (List[Tuple[str, str]]): The list of tuples representing row and column granularities.
+        use_months (bool): Indicates whether to use months for cohort column if cohort_column_granularity is 'monthly'.
+        engine (str, optional): The groupby engine for the operations that support it, e.g. 'numba'. Defaults to None.
+        engine_kwargs (Dict[str, bool], optional): The engine options, e.g. {'parallel': True}. Defaults to None.
+
+    Returns:
+        List[pd.DataFrame]: The DataFrames with cohort granularity metrics.
+    """
+    try:
+        import dask
+    except ImportError as e:
+        raise ImportError(
+            "backend='dask' requires dask: pip install pandas-business[dask]"
+        ) from e
+
+    # partial instead of a lambda so that the task graph can be pickled
+    aggregate = partial(
+        collect_cohort_metrics,
+        cohort_row="cohort_row",
+        cohort_column="cohort_column",
+        metrics=metrics,
+        engine=engine,
+        engine_kwargs=engine_kwargs,
+    )
+    tasks = [
+        dask.delayed(aggregate, pure=False)(df_temp)
+        for df_temp in cohort_granularity_frames(
+            df=df,
+            cohort_event_cols=cohort_event_cols,
+            transaction_event_col=transaction_event_col,
+            row_col_granularities=row_col_granularities,
+            use_months=use_months,
+        )
+    ]
+    return [df_temp for i in dask.compute(*tasks) for df_temp in i]
 
 
 @register_dataframe_method
@@ -264,6 +637,9 @@ def cohort(
         metrics: Dict[str, List[str]],
         row_col_granularities: List[Tuple],
         use_months: bool = False,
+        engine: Optional[str] = None,
+        engine_kwargs: Optional[Dict[str, bool]] = None,
+        backend: str = "pandas",
 ) -> pd.DataFrame:
     """
     Performs cohort analysis on the DataFrame with different row and column granularities and returns the aggregated results.
@@ -275,21 +651,33 @@ def cohort(
         metrics (Dict[str, List[str]]): A dictionary mapping metric target columns to a list of metric operations.
         row_col_granularities (List[Tuple]): The list of tuples representing row and column granularities.
         use_months (bool, optional): Indicates whether to use months for cohort column if cohort_column_granularity is 'monthly'.
+        engine (str, optional): The groupby engine for the operations that support it, e.g. 'numba'. Defaults to None.
+        engine_kwargs (Dict[str, bool], optional): The engine options, e.g. {'parallel': True, 'nogil': True}. Defaults to None.
+        backend (str, optional): How to run the aggregations. Valid values: 'pandas', 'dask' (parallel, requires dask). Defaults to 'pandas'.
 
     Returns:
         pd.DataFrame: The DataFrame with aggregated cohort metrics.
     """
-    iterator = cohort_granularity_metrics(
+    kwargs = dict(
         df=df,
         cohort_event_cols=cohort_event_cols,
         transaction_event_col=transaction_event_col,
         metrics=metrics,
         row_col_granularities=row_col_granularities,
         use_months=use_months,
+        engine=engine,
+        engine_kwargs=engine_kwargs,
     )
-    df_ = pd.DataFrame()
-    for i in iterator:
-        for df_temp in i:
-            df_ = pd.concat([df_, df_temp])
+    if backend == "pandas":
+        parts = list(cohort_granularity_metrics(**kwargs))
+    elif backend == "dask":
+        parts = dask_cohort_granularity_metrics(**kwargs)
+    else:
+        raise ValueError(
+            f"Unknown backend '{backend}'. Valid values: 'pandas', 'dask'."
+        )
+
+    if not parts:
+        return pd.DataFrame()
 
-    return df_
+    return pd.concat(parts, ignore_index=True)
@@ -1,9 +1,12 @@
 # We know, this is not real test
 
 import datetime as dt
+import numpy as np
 import pandas as pd
+import pytest
 
 import pandas_business
+from pandas_business.cohorts import cohort_metrics
 
 
 df = pd.DataFrame(
@@ -24,3 +27,290 @@ df_cohort = df.cohort(
     metrics={"client_life": ["mean"]},
     row_col_granularities=[("monthly", "monthly")],
 )
+
+
+def _sorted_records(df_result, cols=("cohort_row", "cohort_column", "metric_value")):
+    return sorted(
+        tuple(str(value) for value in row)
+        for row in df_result[list(cols)].itertuples(index=False, name=None)
+    )
+
+
+ROW_LABELS = {
+    "monthly": ("2020-01", "2020-02"),
+    "weekly": ("2020-00", "2020-04"),
+    "daily": ("2020-01-01", "2020-02-01"),
+}
+
+# cohort_column of the (2020-01, 2020-03), (2020-01, 2020-04), (2020-02, 2020-03)
+# and (2020-02, 2020-04) groups of the example, summing to 4, 3, 2 and 2
+COLUMN_VALUES = {
+    "monthly": ("2", "3", "1", "2"),
+    "weekly": ("8", "13", "4", "8"),
+    "daily": ("60", "91", "29", "60"),
+}
+
+
+def _cohort_example(df_source=df, **kwargs):
+    kwargs.setdefault("cohort_event_cols", ["month_subscribed"])
+    return df_source.cohort(
+        transaction_event_col="unsubscribed_at",
+        metrics={"client_life": ["sum"]},
+        **kwargs,
+    )
+
+
+@pytest.mark.parametrize("use_months", [False, True])
+@pytest.mark.parametrize("col_granularity", ["monthly", "weekly", "daily"])
+@pytest.mark.parametrize("row_granularity", ["monthly", "weekly", "daily"])
+def test_cohort_known_values(row_granularity, col_granularity, use_months):
+    df_result = _cohort_example(
+        row_col_granularities=[(row_granularity, col_granularity)],
+        use_months=use_months,
+    )
+
+    first, second = ROW_LABELS[row_granularity]
+    columns = (
+        ("2020-03", "2020-04", "2020-03", "2020-04")
+        if use_months
+        else COLUMN_VALUES[col_granularity]
+    )
+    expected = zip((first, first, second, second), columns, ("4", "3", "2", "2"))
+    assert _sorted_records(df_result) == sorted(expected)
+    assert set(df_result["row_granularity"]) == {row_granularity}
+    assert set(df_result["col_granularity"]) == {col_granularity}
+    assert set(df_result["metric_name"]) == {"client_life_sum"}
+    if not use_months:
+        assert df_result["cohort_column"].dtype == "int64"
+
+
+def test_cohort_column_before_cohort_event():
+    df_early = pd.DataFrame(
+        {
+            "start": [dt.datetime(2020, 1, 10), dt.datetime(2020, 1, 10)],
+            "end": [dt.datetime(2020, 1, 1), dt.datetime(2019, 12, 25)],
+            "x": [1, 2],
+        }
+    )
+
+    def run(granularity):
+        return _sorted_records(
+            df_early.cohort(
+                cohort_event_cols=["start"],
+                transaction_event_col="end",
+                metrics={"x": ["sum"]},
+                row_col_granularities=[("monthly", granularity)],
+            )
+        )
+
+    assert run("daily") == [("2020-01", "-16", "2"), ("2020-01", "-9", "1")]
+    # -9 / 7 and -16 / 7 weeks are truncated towards zero
+    assert run("weekly") == [("2020-01", "-1", "1"), ("2020-01", "-2", "2")]
+    assert run("monthly") == [("2020-01", "-1", "2"), ("2020-01", "0", "1")]
+
+
+def test_cohort_tz_aware_dates_use_local_calendar():
+    df_tz = pd.DataFrame(
+        {
+            "start": pd.Series(
+                pd.to_datetime(["2020-02-15 00:00", "2020-01-31 23:30", "2020-03-28 00:00"])
+            ).dt.tz_localize("Europe/Madrid"),
+            "end": pd.Series(
+                pd.to_datetime(["2020-02-29 23:30", "2020-03-01 00:30", "2020-03-30 00:00"])
+            ).dt.tz_localize("Europe/Madrid"),
+            "x": [1, 2, 3],
+        }
+    )
+
+    def run(granularity, use_months=False):
+        return _sorted_records(
+            df_tz.cohort(
+                cohort_event_cols=["start"],
+                transaction_event_col="end",
+                metrics={"x": ["sum"]},
+                row_col_granularities=[(granularity, granularity)],
+                use_months=use_months,
+            )
+        )
+
+    # labels and months follow the local calendar
+    assert run("monthly") == [("2020-01", "2", "2"), ("2020-02", "0", "1"), ("2020-03", "0", "3")]
+    assert run("monthly", use_months=True) == [
+        ("2020-01", "2020-03", "2"),
+        ("2020-02", "2020-02", "1"),
+        ("2020-03", "2020-03", "3"),
+    ]
+    assert run("weekly") == [("2020-04", "4", "2"), ("2020-06", "2", "1"), ("2020-12", "0", "3")]
+    # days are elapsed time: the DST change makes 2020-03-28 -> 2020-03-30 47 hours
+    assert run("daily") == [
+        ("2020-01-31", "29", "2"),
+        ("2020-02-15", "14", "1"),
+        ("2020-03-28", "1", "3"),
+    ]
+
+
+def test_cohort_without_rows_is_empty():
+    df_missing = df.assign(unsubscribed_at=pd.NaT)
+
+    for df_input in (df.iloc[:0], df_missing):
+        df_result = _cohort_example(
+            df_input, row_col_granularities=[("monthly", "monthly")]
+        )
+        assert isinstance(df_result, pd.DataFrame)
+        assert df_result.empty
+
+
+def test_cohort_drops_rows_with_missing_dates():
+    df_nat = pd.concat(
+        [
+            df,
+            pd.DataFrame(
+                {
+                    "month_subscribed": [pd.NaT, dt.datetime(2020, 1, 1)],
+                    "unsubscribed_at": [dt.datetime(2020, 3, 1), pd.NaT],
+                    "client_life": [100, 100],
+                }
+            ),
+        ],
+        ignore_index=True,
+    )
+    granularities = [("monthly", "monthly"), ("weekly", "daily")]
+
+    assert _sorted_records(
+        _cohort_example(df_nat, row_col_granularities=granularities)
+    ) == _sorted_records(_cohort_example(row_col_granularities=granularities))
+
+
+def _with_payment_dates():
+    df_input = df.assign(
+        month_paid=df["month_subscribed"] + pd.Timedelta(days=10)
+    )
+    df_input.loc[0, "month_paid"] = pd.NaT
+    return df_input
+
+
+def test_cohort_events_are_independent():
+    # the missing payment must only drop the row from the month_paid cohort
+    df_input = _with_payment_dates()
+    granularities = [("monthly", "monthly"), ("weekly", "daily")]
+
+    df_result = _cohort_example(
+        df_input,
+        cohort_event_cols=["month_subscribed", "month_paid"],
+        row_col_granularities=granularities,
+    )
+
+    for event in ("month_subscribed", "month_paid"):
+        df_single = _cohort_example(
+            df_input, cohort_event_cols=[event], row_col_granularities=granularities
+        )
+        assert _sorted_records(
+            df_result[df_result["cohort_event"] == event], cols=df_result.columns
+        ) == _sorted_records(df_single, cols=df_single.columns)
+    assert _sorted_records(
+        df_result[
+            (df_result["cohort_event"] == "month_subscribed")
+            & (df_result["row_granularity"] == "monthly")
+        ]
+    ) == [("2020-01", "2", "4"), ("2020-01", "3", "3"), ("2020-02", "1", "2"), ("2020-02", "2", "2")]
+    assert _sorted_records(
+        df_result[
+            (df_result["cohort_event"] == "month_paid")
+            & (df_result["row_granularity"] == "monthly")
+        ]
+    ) == [("2020-01", "2", "2"), ("2020-01", "3", "3"), ("2020-02", "1", "2"), ("2020-02", "2", "2")]
+
+
+def test_cohort_without_metric_operations_is_empty():
+    for metrics in ({}, {"client_life": []}):
+        df_result = df.cohort(
+            cohort_event_cols=["month_subscribed"],
+            transaction_event_col="unsubscribed_at",
+            metrics=metrics,
+            row_col_granularities=[("monthly", "monthly")],
+        )
+        assert df_result.empty
+
+
+def _cohort_with_engine(metrics, **kwargs):
+    df_result = df.cohort(
+        cohort_event_cols=["month_subscribed"],
+        transaction_event_col="unsubscribed_at",
+        metrics=metrics,
+        row_col_granularities=[("monthly", "monthly"), ("weekly", "daily")],
+        **kwargs,
+    )
+    return _sorted_records(df_result, cols=df_result.columns)
+
+
+def test_cohort_engine_does_not_change_results():
+    metrics = {"client_life": ["sum", "sum", np.mean, "count"]}
+    expected = _cohort_with_engine(metrics)
+
+    assert len(expected) == 4 * 8
+    assert {record[5] for record in expected} == {
+        "client_life_sum",
+        "client_life_mean",
+        "client_life_count",
+    }
+    assert _cohort_with_engine(metrics, engine="cython") == expected
+
+
+def test_cohort_numba_engine():
+    pytest.importorskip("numba")
+    metrics = {"client_life": ["sum", "mean", "max", "count"]}
+
+    assert _cohort_with_engine(
+        metrics, engine="numba", engine_kwargs={"parallel": False}
+    ) == _cohort_with_engine(metrics)
+
+
+def test_cohort_dask_backend_matches_pandas():
+    pytest.importorskip("dask")
+    kwargs = dict(
+        cohort_event_cols=["month_subscribed", "unsubscribed_at"],
+        row_col_granularities=[("monthly", "monthly"), ("weekly", "daily")],
+    )
+    df_pandas = _cohort_example(**kwargs)
+    df_dask = _cohort_example(backend="dask", **kwargs)
+
+    assert list(df_dask.columns) == list(df_pandas.columns)
+    assert _sorted_records(df_dask, cols=df_dask.columns) == _sorted_records(
+        df_pandas, cols=df_pandas.columns
+    )
+
+
+def test_cohort_metrics_of_empty_frame_yields_nothing():
+    df_empty = pd.DataFrame(
+        {
+            "cohort_row": pd.Series([], dtype="category"),
+            "cohort_column": pd.Series([], dtype="int64"),
+            "cohort_event": pd.Series([], dtype="category"),
+            "row_granularity": pd.Series([], dtype="category"),
+            "col_granularity": pd.Series([], dtype="category"),
+            "client_life": pd.Series([], dtype="int64"),
+        }
+    )
+
+    assert list(
+        cohort_metrics(
+            df_empty,
+            cohort_row="cohort_row",
+            cohort_column="cohort_column",
+            metrics={"client_life": ["sum"]},
+        )
+    ) == []
+
+
+def test_cohort_does_not_mutate_input():
+    df_input = _with_payment_dates()
+    df_copy = df_input.copy()
+
+    df_input.cohort(
+        cohort_event_cols=["month_subscribed", "month_paid"],
+        transaction_event_col="unsubscribed_at",
+        metrics={"client_life": ["sum", "mean"]},
+        row_col_granularities=[("monthly", "monthly"), ("daily", "weekly")],
+    )
+
+    pd.testing.assert_frame_equal(df_input, df_copy)